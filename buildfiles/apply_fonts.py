@@ -5,11 +5,15 @@ Reads font_config.env and generates preamble.tex from preamble.tex.template.
 """
 import sys
 import os
+import re
+import functools
+from pathlib import Path
+
+# {{VARIABLE}} placeholders in preamble.tex.template
+PLACEHOLDER_RE = re.compile(r'\{\{(\w+)\}\}')
 
 def load_font_config(config_path='buildfiles/font_config.env'):
     """Load font configuration from .env file."""
-    config = {}
-
     if not os.path.exists(config_path):
         print(f"Warning: {config_path} not found, using defaults")
         return {
@@ -20,33 +24,36 @@ def load_font_config(config_path='buildfiles/font_config.env'):
             'TABLE_FONT_SCALE': '1.0'
         }
 
-    with open(config_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
+    # The mtime is part of the cache key so edits to the file are picked up
+    return dict(_parse_font_config(config_path, os.path.getmtime(config_path)))
+
+@functools.lru_cache(maxsize=4)
+def _parse_font_config(config_path, mtime):
+    """Parse KEY=value lines of a font config file (cached per path/mtime)."""
+    config = {}
+
+    for line in Path(config_path).read_text().splitlines():
+        line = line.strip()
+        if not line or line.startswith('#'):
+            continue
 
-            if '=' in line:
-                key, value = line.split('=', 1)
-                # Remove quotes if present
-                value = value.strip().strip('"').strip("'")
-                config[key] = value
+        if '=' in line:
+            key, value = line.split('=', 1)
+            # Remove quotes if present
+            value = value.strip().strip('"').strip("'")
+            config[key] = value
 
     return config
 
 def apply_to_preamble(config, template_path='buildfiles/preamble.tex.template',
                       output_path='buildfiles/preamble.tex'):
     """Generate preamble.tex from template with font substitutions."""
-    with open(template_path, 'r') as f:
-        content = f.read()
+    content = Path(template_path).read_text()
 
-    # Substitute all {{VARIABLE}} patterns
-    for key, value in config.items():
-        placeholder = '{{' + key + '}}'
-        content = content.replace(placeholder, value)
+    # Substitute all {{VARIABLE}} patterns in one pass (unknown ones are kept)
+    content = PLACEHOLDER_RE.sub(lambda m: config.get(m.group(1), m.group(0)), content)
 
-    with open(output_path, 'w') as f:
-        f.write(content)
+    Path(output_path).write_text(content)
 
     print(f"✓ Generated {output_path}")
     print(f"  Math font: {config.get('MATH_FONT', 'not set')}")
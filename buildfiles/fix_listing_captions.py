@@ -6,24 +6,46 @@ Extracts caption text from notebook and injects into LaTeX \caption{} commands.
 import sys
 import json
 import re
+from pathlib import Path
+
+try:
+    # Optional: orjson parses large notebooks several times faster
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# LaTeX special characters escaped in caption text
+LATEX_ESCAPE = str.maketrans({'_': r'\_', '%': r'\%', '&': r'\&'})
+
+# Quarto cell directives
+LABEL_RE = re.compile(r'#\| label: (lst-[\w-]+)')
+CAPTION_RE = re.compile(r'#\| fig-cap: ["\']([^"\']+)["\']')
 
 def extract_captions_from_notebook(notebook_path):
     """Extract fig-cap text for each lst- label from notebook."""
-    with open(notebook_path, 'r') as f:
-        nb = json.load(f)
+    # Raw bytes: one read, no text decoding/newline translation of the
+    # (often large) output data; both JSON parsers accept bytes directly
+    raw = Path(notebook_path).read_bytes()
     
     captions = {}
+    
+    # Most of a rendered notebook is cell output (often base64 images).
+    # Skip decoding it entirely when no cell declares a listing label.
+    if b'label: lst-' not in raw:
+        return captions
+    
+    nb = json_loads(raw)
     for cell in nb['cells']:
         if cell['cell_type'] == 'code':
             source = ''.join(cell['source'])
             
             # Find label
-            label_match = re.search(r'#\| label: (lst-[\w-]+)', source)
-            if label_match:
+            label_match = LABEL_RE.search(source)
+            if label_match and 'fig-cap' in source:
                 label = label_match.group(1)
                 
                 # Find fig-cap
-                cap_match = re.search(r'#\| fig-cap: ["\']([^"\']+)["\']', source)
+                cap_match = CAPTION_RE.search(source)
                 if cap_match:
                     captions[label] = cap_match.group(1)
     
@@ -31,23 +53,23 @@ def extract_captions_from_notebook(notebook_path):
 
 def fix_latex_captions(tex_path, captions):
     r"""Inject caption text into empty \caption{} commands in LaTeX."""
-    with open(tex_path, 'r') as f:
-        content = f.read()
+    content = Path(tex_path).read_text()
     
-    # For each label, find and fix its caption
-    for label, caption_text in captions.items():
+    if captions:
         # Escape special LaTeX characters in caption
-        escaped_caption = caption_text.replace('_', r'\_').replace('%', r'\%').replace('&', r'\&')
+        escaped = {label: text.translate(LATEX_ESCAPE) for label, text in captions.items()}
         
         # Find pattern: \caption{\label{lst-xxx}} and replace with: \caption{Text\label{lst-xxx}}
-        # Use literal string matching, not regex
-        old_pattern = '\\caption{\\label{' + label + '}}'
-        new_pattern = '\\caption{' + escaped_caption + '\\label{' + label + '}}'
-        
-        content = content.replace(old_pattern, new_pattern)
+        # All labels are matched in a single scan of the file
+        pattern = re.compile(
+            r'\\caption\{\\label\{(' + '|'.join(map(re.escape, captions)) + r')\}\}'
+        )
+        content = pattern.sub(
+            lambda m: '\\caption{' + escaped[m.group(1)] + '\\label{' + m.group(1) + '}}',
+            content
+        )
     
-    with open(tex_path, 'w') as f:
-        f.write(content)
+    Path(tex_path).write_text(content)
     
     return len(captions)
 
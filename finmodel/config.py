@@ -18,6 +18,16 @@ class Config:
     # Text detection thresholds
     LONG_TEXT_THRESHOLD = 30
     MEDIUM_TEXT_THRESHOLD = 15
+    # Rows sampled when averaging text length (keeps detection O(1) on long columns)
+    TEXT_LENGTH_SAMPLE_ROWS = 100
+
+    # On-disk cache for parsed Excel results (list_tables, read_all_tables);
+    # set to None to disable it
+    CACHE_DIR = "~/.cache/finmodel"
+    # Entries unused for longer than this are deleted, then the least recently
+    # used ones until the directory fits in CACHE_MAX_BYTES
+    CACHE_MAX_AGE_DAYS = 30
+    CACHE_MAX_BYTES = 256 * 1024 * 1024
 
     # Keywords for column type detection (English and German support)
     TEXT_HEAVY_KEYWORDS = {
@@ -5,11 +5,117 @@ Converts DataFrames to HTML with inline CSS styles for Jupyter/Quarto.
 Also provides LaTeX output with proper color commands for PDF.
 """
 
+import io
+import re
+from functools import lru_cache
+from typing import Tuple
+
+import numpy as np
 import pandas as pd
 from .styles import TableStyle
 from .config import Config
 
 
+# LaTeX special characters escaped in table text (single pass via str.translate)
+LATEX_ESCAPE = str.maketrans({"_": "\\_", "%": "\\%", "&": "\\&"})
+
+# Static part of the Ok/No assertion cell style; the background colour is
+# read from Config per table so runtime overrides still apply
+ASSERTION_CSS = "color: #000000; text-align: center; font-weight: bold"
+
+# Padding/border appended to every HTML cell style
+CELL_BORDER_CSS = "padding: 8px; border: 1px solid #000;"
+
+
+@lru_cache(maxsize=8)
+def _keyword_pattern(keywords: frozenset) -> re.Pattern:
+    """Compile a keyword set into one alternation so a name is scanned once."""
+    if not keywords:
+        return re.compile(r'(?!)')  # Never matches, like any() over an empty set
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+def _format_number(value) -> str:
+    """Format an int/float for display in a financial table."""
+    if isinstance(value, float):
+        # Check if it's a percentage (small values)
+        if abs(value) < 1 and value != 0:
+            return f"{value:.4f}"
+        return f"{value:,.2f}"
+    return f"{value:,}"
+
+
+def _format_numeric_column(col: pd.Series):
+    """
+    Format a whole numeric column with one formatter chosen from its dtype.
+
+    Returns None when the column is not a plain numpy int/float column
+    (object, bool, nullable extension types), so callers fall back to
+    formatting cell by cell.
+    """
+    if not isinstance(col.dtype, np.dtype):
+        return None
+    kind = col.dtype.kind
+    if kind == 'f':
+        return [f"{v:.4f}" if abs(v) < 1 and v != 0 else f"{v:,.2f}" for v in col.tolist()]
+    if kind in 'iu':
+        return [f"{v:,}" for v in col.tolist()]
+    return None
+
+
+def _row_dtype_columns(df: pd.DataFrame) -> list:
+    """
+    The frame's columns with values as a row-by-row render sees them.
+
+    Rows (iterrows, df.values) hold every value in the frame's common dtype:
+    next to a float column, ints become floats ("5.00"), and nullable Int64
+    becomes float with NaN. Converting once here lets the formatters work
+    column by column while keeping that row-wise output.
+    """
+    dtypes = set(df.dtypes)
+    if len(dtypes) == 1 and isinstance(next(iter(dtypes)), np.dtype):
+        return [df.iloc[:, i] for i in range(df.shape[1])]
+    values = df.values
+    # Explicit dtype: object columns must not be re-inferred (None -> NaN)
+    return [pd.Series(values[:, i], dtype=values.dtype) for i in range(values.shape[1])]
+
+
+def _cell_text(value) -> str:
+    """Text of a non-numeric HTML cell; None and pd.NA render empty."""
+    return "" if value is None or value is pd.NA else str(value)
+
+
+def _cell_tags(style: TableStyle) -> Tuple[str, str, str]:
+    """
+    Build the opening <th>/<td> tags for a table style.
+
+    Each CellStyle is converted to CSS once per table; cells then only
+    append their content and closing tag.
+    """
+    return (
+        f'      <th style="{style.header_style.to_css()}; {CELL_BORDER_CSS}">',
+        f'      <td style="{style.index_style.to_css()}; {CELL_BORDER_CSS}">',
+        f'      <td style="{style.data_style.to_css()}; {CELL_BORDER_CSS}">',
+    )
+
+
+def _render_repeated(values, render) -> list:
+    """
+    Render a column with few distinct values (e.g. Ok/No assertions).
+
+    Each distinct value is rendered once and its string object is shared by
+    every cell holding that value, instead of building a fresh copy per cell.
+    """
+    rendered = {}
+    cells = []
+    for value in values:
+        cell = rendered.get(value)
+        if cell is None:
+            cell = rendered[value] = render(value)
+        cells.append(cell)
+    return cells
+
+
 def format_table(df: pd.DataFrame, style: TableStyle, assertion_columns=None) -> str:
     """
     Format a DataFrame as HTML with inline styles.
@@ -25,79 +131,76 @@ def format_table(df: pd.DataFrame, style: TableStyle, assertion_columns=None) ->
     if df.empty:
         return "<p>Empty table</p>"
     
-    if assertion_columns is None:
-        assertion_columns = []
+    # Set for O(1) membership checks, whatever iterable the caller passed
+    assertion_columns = frozenset(assertion_columns or ())
     
-    # Start HTML
-    html = [f'<table style="border-collapse: collapse; font-family: {Config.TABLE_FONT_FAMILY}; font-size: 10pt; margin: 1em 0;">']
+    # Resolve cell styles once, not per cell
+    header_th, index_td, data_td = _cell_tags(style)
+    assertion_td = {
+        'Ok': f'      <td style="background-color: {Config.ASSERTION_OK_COLOR}; {ASSERTION_CSS}; {CELL_BORDER_CSS}">',
+        'No': f'      <td style="background-color: {Config.ASSERTION_NO_COLOR}; {ASSERTION_CSS}; {CELL_BORDER_CSS}">',
+    }
+    
+    # Start HTML - streamed into one buffer rather than collecting lines to join
+    buf = io.StringIO()
+    w = buf.write
+    w(f'<table style="border-collapse: collapse; font-family: {Config.TABLE_FONT_FAMILY}; font-size: 10pt; margin: 1em 0;">\n')
     
     # Add header row
-    html.append('  <thead>')
-    html.append('    <tr>')
+    w('  <thead>\n')
+    w('    <tr>\n')
     
     # Index column header (if index has a name)
     if df.index.name:
-        header_css = style.header_style.to_css()
-        html.append(f'      <th style="{header_css}; padding: 8px; border: 1px solid #000;">{df.index.name}</th>')
+        w(f'{header_th}{df.index.name}</th>\n')
     elif df.index.name is None:
         # Empty index column header
-        header_css = style.header_style.to_css()
-        html.append(f'      <th style="{header_css}; padding: 8px; border: 1px solid #000;"></th>')
+        w(f'{header_th}</th>\n')
     
     # Regular column headers
-    header_css = style.header_style.to_css()
     for col in df.columns:
-        html.append(f'      <th style="{header_css}; padding: 8px; border: 1px solid #000;">{col}</th>')
+        w(f'{header_th}{col}</th>\n')
+    
+    w('    </tr>\n')
+    w('  </thead>\n')
     
-    html.append('    </tr>')
-    html.append('  </thead>')
+    # Render every data cell column by column, then stitch the rows together
+    columns = []
+    for col_name, col in zip(df.columns, _row_dtype_columns(df)):
+        numbers = None if col_name in assertion_columns else _format_numeric_column(col)
+        cells = []
+        if col_name in assertion_columns:
+            # Assertion columns get special styling
+            cells = _render_repeated(
+                col.tolist(),
+                lambda value: f'{assertion_td.get(value, data_td)}{_cell_text(value)}</td>'
+            )
+        elif numbers is not None:
+            cells = [f'{data_td}{formatted}</td>' for formatted in numbers]
+        else:
+            # Regular data column - format numbers nicely
+            for value in col.tolist():
+                if isinstance(value, (int, float)):
+                    formatted = _format_number(value)
+                else:
+                    formatted = _cell_text(value)
+                cells.append(f'{data_td}{formatted}</td>')
+        columns.append(cells)
     
     # Add body rows
-    html.append('  <tbody>')
+    w('  <tbody>\n')
     
-    for idx, row in df.iterrows():
-        html.append('    <tr>')
-        
+    for idx, *cells in zip(df.index, *columns):
+        w('    <tr>\n')
         # Index column (Column A)
-        index_css = style.index_style.to_css()
-        html.append(f'      <td style="{index_css}; padding: 8px; border: 1px solid #000;">{idx}</td>')
-        
-        # Data columns
-        for col_name, value in row.items():
-            # Check if this is an assertion column
-            if col_name in assertion_columns:
-                # Assertion columns get special styling
-                if value == 'Ok':
-                    cell_css = f"background-color: {Config.ASSERTION_OK_COLOR}; color: #000000; text-align: center; font-weight: bold"
-                elif value == 'No':
-                    cell_css = f"background-color: {Config.ASSERTION_NO_COLOR}; color: #000000; text-align: center; font-weight: bold"
-                else:
-                    cell_css = style.data_style.to_css()
-                formatted = str(value) if value is not None else ""
-            else:
-                # Regular data column
-                cell_css = style.data_style.to_css()
-                # Format numbers nicely
-                if isinstance(value, (int, float)):
-                    if isinstance(value, float):
-                        # Check if it's a percentage (small values)
-                        if abs(value) < 1 and value != 0:
-                            formatted = f"{value:.4f}"
-                        else:
-                            formatted = f"{value:,.2f}"
-                    else:
-                        formatted = f"{value:,}"
-                else:
-                    formatted = str(value) if value is not None else ""
-            
-            html.append(f'      <td style="{cell_css}; padding: 8px; border: 1px solid #000;">{formatted}</td>')
-        
-        html.append('    </tr>')
+        w(f'{index_td}{idx}</td>\n')
+        w('\n'.join(cells))
+        w('\n    </tr>\n')
     
-    html.append('  </tbody>')
-    html.append('</table>')
+    w('  </tbody>\n')
+    w('</table>')
     
-    return '\n'.join(html)
+    return buf.getvalue()
 
 
 def format_key_value_table(df: pd.DataFrame, style: TableStyle) -> str:
@@ -118,56 +221,59 @@ def format_key_value_table(df: pd.DataFrame, style: TableStyle) -> str:
     if df.empty:
         return "<p>Empty table</p>"
     
-    html = [f'<table style="border-collapse: collapse; font-family: {Config.TABLE_FONT_FAMILY}; font-size: 10pt; margin: 1em 0;">']
+    # Resolve cell styles once, not per cell
+    header_th, index_td, data_td = _cell_tags(style)
+    
+    # Stream the markup into one buffer rather than collecting lines to join
+    buf = io.StringIO()
+    w = buf.write
+    w(f'<table style="border-collapse: collapse; font-family: {Config.TABLE_FONT_FAMILY}; font-size: 10pt; margin: 1em 0;">\n')
     
     # Header row (column names)
     if df.columns.notna().any():
-        html.append('  <thead>')
-        html.append('    <tr>')
+        w('  <thead>\n')
+        w('    <tr>\n')
         
         # First column header (empty for index)
-        header_css = style.header_style.to_css()
-        html.append(f'      <th style="{header_css}; padding: 8px; border: 1px solid #000;"></th>')
+        w(f'{header_th}</th>\n')
         
         for col in df.columns:
             col_name = str(col) if pd.notna(col) else ""
-            html.append(f'      <th style="{header_css}; padding: 8px; border: 1px solid #000;">{col_name}</th>')
+            w(f'{header_th}{col_name}</th>\n')
         
-        html.append('    </tr>')
-        html.append('  </thead>')
+        w('    </tr>\n')
+        w('  </thead>\n')
     
-    # Body rows
-    html.append('  <tbody>')
-    
-    for idx, row in df.iterrows():
-        html.append('    <tr>')
-        
-        # Index cell (parameter name)
-        index_css = style.index_style.to_css()
-        html.append(f'      <td style="{index_css}; padding: 8px; border: 1px solid #000;">{idx}</td>')
-        
-        # Value cells
-        data_css = style.data_style.to_css()
-        for value in row:
+    # Value cells, rendered once per column
+    columns = []
+    for col in _row_dtype_columns(df):
+        numbers = _format_numeric_column(col)
+        if numbers is not None:
+            columns.append([f'{data_td}{formatted}</td>' for formatted in numbers])
+            continue
+        cells = []
+        for value in col.tolist():
             if isinstance(value, (int, float)):
-                if isinstance(value, float):
-                    if abs(value) < 1 and value != 0:
-                        formatted = f"{value:.4f}"
-                    else:
-                        formatted = f"{value:,.2f}"
-                else:
-                    formatted = f"{value:,}"
+                formatted = _format_number(value)
             else:
                 formatted = str(value) if pd.notna(value) else ""
-            
-            html.append(f'      <td style="{data_css}; padding: 8px; border: 1px solid #000;">{formatted}</td>')
-        
-        html.append('    </tr>')
+            cells.append(f'{data_td}{formatted}</td>')
+        columns.append(cells)
     
-    html.append('  </tbody>')
-    html.append('</table>')
+    # Body rows
+    w('  <tbody>\n')
     
-    return '\n'.join(html)
+    for idx, *cells in zip(df.index, *columns):
+        w('    <tr>\n')
+        # Index cell (parameter name)
+        w(f'{index_td}{idx}</td>\n')
+        w('\n'.join(cells))
+        w('\n    </tr>\n')
+    
+    w('  </tbody>\n')
+    w('</table>')
+    
+    return buf.getvalue()
 
 
 def format_table_latex(df, style, hide_index=False, assertion_columns=None):
@@ -179,14 +285,11 @@ def format_table_latex(df, style, hide_index=False, assertion_columns=None):
         hide_index: If True, hide the index column (default: False)
         assertion_columns: List of column names that contain assertion results (Ok/No)
     """
-    import pandas as pd
-    import re
-
     if df.empty:
         return ""
     
-    if assertion_columns is None:
-        assertion_columns = []
+    # Set for O(1) membership checks, whatever iterable the caller passed
+    assertion_columns = frozenset(assertion_columns or ())
 
     # Get background colors
     header_bg = (style.header_style.background_color or "").replace("#", "")
@@ -197,6 +300,12 @@ def format_table_latex(df, style, hide_index=False, assertion_columns=None):
     ok_bg = Config.ASSERTION_OK_COLOR.replace("#", "")
     no_bg = Config.ASSERTION_NO_COLOR.replace("#", "")
 
+    # Cell prefixes are constant per table, so build them once
+    index_prefix = "\\cellcolor[HTML]{" + index_bg + "}" if index_bg else ""
+    data_prefix = "\\cellcolor[HTML]{" + data_bg + "}" if data_bg else ""
+    ok_prefix = "\\cellcolor[HTML]{" + ok_bg + "}\\textbf{"
+    no_prefix = "\\cellcolor[HTML]{" + no_bg + "}\\textbf{"
+
     # Intelligent column type detection
     def detect_column_type(col_name, col_data):
         """Auto-detect column type."""
@@ -211,15 +320,16 @@ def format_table_latex(df, style, hide_index=False, assertion_columns=None):
             return 'numeric'
 
         # WKN/ISIN/Code detection
-        if any(kw in col_name_lower for kw in Config.CODE_KEYWORDS):
+        if _keyword_pattern(frozenset(Config.CODE_KEYWORDS)).search(col_name_lower):
             return 'code'
 
         # Text-heavy column detection
-        if any(keyword in col_name_lower for keyword in Config.TEXT_HEAVY_KEYWORDS):
+        if _keyword_pattern(frozenset(Config.TEXT_HEAVY_KEYWORDS)).search(col_name_lower):
             return 'long_text'
 
-        # Auto-detect by average text length
-        avg_length = col_data.astype(str).str.len().mean()
+        # Auto-detect by average text length (leading sample of the column)
+        sample = col_data.iloc[:Config.TEXT_LENGTH_SAMPLE_ROWS]
+        avg_length = sample.astype(str).str.len().mean()
         if avg_length > Config.LONG_TEXT_THRESHOLD:
             return 'long_text'
         elif avg_length > Config.MEDIUM_TEXT_THRESHOLD:
@@ -234,9 +344,10 @@ def format_table_latex(df, style, hide_index=False, assertion_columns=None):
     if not hide_index:
         col_specs.append("l")  # Index column
 
-    for col_name in df.columns:
-        col_type = detect_column_type(col_name, df[col_name])
+    # Detect each column's type once; the row loop below reuses it
+    col_types = [detect_column_type(col_name, df.iloc[:, i]) for i, col_name in enumerate(df.columns)]
 
+    for col_type in col_types:
         if col_type == 'assertion':
             col_specs.append("c")  # Center-aligned for Ok/No
         elif col_type == 'numeric':
@@ -267,11 +378,11 @@ def format_table_latex(df, style, hide_index=False, assertion_columns=None):
 
     # Add index header if not hidden
     if not hide_index:
-        index_name = str(df.index.name).replace("_", "\\_").replace("%", "\\%").replace("&", "\\&") if df.index.name else ""
+        index_name = str(df.index.name).translate(LATEX_ESCAPE) if df.index.name else ""
         headers.append(index_name)
 
     # Add data column headers (with LaTeX escaping)
-    headers.extend([str(c).replace("_", "\\_").replace("%", "\\%").replace("&", "\\&") for c in df.columns])
+    headers.extend([str(c).translate(LATEX_ESCAPE) for c in df.columns])
 
     if header_bg:
         latex.append("\\rowcolor[HTML]{" + header_bg + "}")
@@ -279,69 +390,64 @@ def format_table_latex(df, style, hide_index=False, assertion_columns=None):
     latex.append("\\midrule")
     latex.append("\\endhead")
     
-    # Data rows
-    for idx, row in df.iterrows():
-        cells = []
+    def format_assertion(val):
+        """Format an assertion (Ok/No) cell."""
+        formatted = str(val) if pd.notna(val) else ""
+        if val == 'Ok':
+            return ok_prefix + formatted + "}"
+        elif val == 'No':
+            return no_prefix + formatted + "}"
+        return data_prefix + formatted
+
+    def format_value(val, col_type):
+        """Format a regular data cell based on its column type."""
+        if isinstance(val, (int, float)):
+            formatted = _format_number(val)
+        else:
+            formatted = str(val) if pd.notna(val) else ""
+            # Escape special LaTeX characters
+            formatted = formatted.translate(LATEX_ESCAPE)
+
+            # Apply small font to WKN/ISIN codes
+            if col_type == 'code' and formatted:
+                formatted = "{\\small " + formatted + "}"
+
+            # Apply tiny font + line breaks to long produktname text
+            elif col_type == 'long_text' and len(formatted) > 20:
+                # Insert line break at spaces for long product names
+                words = formatted.split()
+                if len(words) > 1:
+                    mid = len(words) // 2
+                    formatted = ' '.join(words[:mid]) + " " + ' '.join(words[mid:])
+                formatted = "{\\tiny " + formatted + "}"
+
+        return data_prefix + formatted
+
+    # Data cells - each column picks its renderer once; only mixed/text
+    # columns fall through to per-cell dispatch in format_value
+    columns = []
+    for col_type, col in zip(col_types, _row_dtype_columns(df)):
+        if col_type == 'assertion':
+            columns.append(_render_repeated(col.tolist(), format_assertion))
+            continue
 
-        # Add index cell if not hidden
-        if not hide_index:
-            index_val = str(idx) if pd.notna(idx) else ""
+        numbers = _format_numeric_column(col)
+        if numbers is not None:
+            columns.append([data_prefix + formatted for formatted in numbers])
+        else:
+            columns.append([format_value(val, col_type) for val in col.tolist()])
+
+    # Add index cells if not hidden
+    if not hide_index:
+        index_cells = [
             # Escape special LaTeX characters
-            index_val = index_val.replace("_", "\\_").replace("%", "\\%").replace("&", "\\&")
-            if index_bg:
-                cells.append("\\cellcolor[HTML]{" + index_bg + "}" + index_val)
-            else:
-                cells.append(index_val)
-
-        # Data cells - apply intelligent formatting based on column type
-        for i, val in enumerate(row):
-            col_name = df.columns[i]
-            col_type = detect_column_type(col_name, df.iloc[:, i])
-            
-            # Handle assertion columns
-            if col_type == 'assertion':
-                formatted = str(val) if pd.notna(val) else ""
-                if val == 'Ok':
-                    cells.append("\\cellcolor[HTML]{" + ok_bg + "}\\textbf{" + formatted + "}")
-                elif val == 'No':
-                    cells.append("\\cellcolor[HTML]{" + no_bg + "}\\textbf{" + formatted + "}")
-                else:
-                    if data_bg:
-                        cells.append("\\cellcolor[HTML]{" + data_bg + "}" + formatted)
-                    else:
-                        cells.append(formatted)
-                continue
-
-            if isinstance(val, (int, float)):
-                if isinstance(val, float) and abs(val) < 1 and val != 0:
-                    formatted = f"{val:.4f}"
-                elif isinstance(val, float):
-                    formatted = f"{val:,.2f}"
-                else:
-                    formatted = f"{val:,}"
-            else:
-                formatted = str(val) if pd.notna(val) else ""
-                # Escape special LaTeX characters
-                formatted = formatted.replace("_", "\\_").replace("%", "\\%").replace("&", "\\&")
-
-                # Apply small font to WKN/ISIN codes
-                if col_type == 'code' and formatted:
-                    formatted = "{\\small " + formatted + "}"
-
-                # Apply tiny font + line breaks to long produktname text
-                elif col_type == 'long_text' and len(formatted) > 20:
-                    # Insert line break at spaces for long product names
-                    words = formatted.split()
-                    if len(words) > 1:
-                        mid = len(words) // 2
-                        formatted = ' '.join(words[:mid]) + " " + ' '.join(words[mid:])
-                    formatted = "{\\tiny " + formatted + "}"
-
-            if data_bg:
-                cells.append("\\cellcolor[HTML]{" + data_bg + "}" + formatted)
-            else:
-                cells.append(formatted)
+            index_prefix + (str(idx) if pd.notna(idx) else "").translate(LATEX_ESCAPE)
+            for idx in df.index
+        ]
+        columns.insert(0, index_cells)
 
+    # Data rows
+    for cells in zip(*columns):
         latex.append(" & ".join(cells) + " \\\\")
 
     latex.append("\\bottomrule")
@@ -5,8 +5,12 @@ Provides automatic ANSI → HTML (Jupyter) and ANSI → LaTeX (PDF) conversion
 for plotext terminal charts, maintaining monospace font styling.
 """
 
-from typing import Literal, Optional
-from ansi2html import Ansi2HTMLConverter
+import html
+import io
+import re
+from functools import lru_cache
+from itertools import chain
+from typing import Iterable, Iterator, List, Literal, Optional
 from .config import Config
 
 
@@ -18,6 +22,127 @@ LATEX_FONT_SIZES = {
     'large': r'\large',
 }
 
+# Verbatim environment (prefix, suffix) around the chart body for each size,
+# with the typewriter font. Built once; only the body varies per render
+LATEX_WRAPPERS = {
+    size: (
+        '\n'.join([r'\begin{Verbatim}[commandchars=\\\{\}]', font_size, r'\ttfamily', '']),
+        '\n' + r'\end{Verbatim}',
+    )
+    for size, font_size in LATEX_FONT_SIZES.items()
+}
+
+# ANSI SGR escape sequence \x1b[XXm (the captured group is the code list)
+ANSI_ESCAPE_RE = re.compile(r'\x1b\[([0-9;]+)m')
+
+# 256-color background codes, which the LaTeX output ignores. plotext emits
+# one before almost every foreground code, so they are stripped in C (re.sub)
+# rather than stepped through one by one in the conversion loop
+ANSI_BACKGROUND_RE = re.compile(r'\x1b\[48;5;[0-9]+m')
+
+# LaTeX special characters in chart text, escaped in a single pass
+LATEX_ESCAPE = str.maketrans({
+    '\\': r'\textbackslash{}',
+    '{': r'\{',
+    '}': r'\}',
+    '_': r'\_',
+    '^': r'\textasciicircum{}',
+    '~': r'\textasciitilde{}',
+    '#': r'\#',
+    '$': r'\$',
+    '%': r'\%',
+    '&': r'\&',
+})
+
+# The characters LATEX_ESCAPE replaces. Plotext art rarely contains any of
+# them, and ten substring checks are far cheaper than a translate() pass
+LATEX_SPECIALS = tuple(map(chr, LATEX_ESCAPE))
+
+
+def _escape_latex(text: str) -> str:
+    """Escape LaTeX special characters, skipping the pass when there are none."""
+    if any(char in text for char in LATEX_SPECIALS):
+        return text.translate(LATEX_ESCAPE)
+    return text
+
+# ANSI color code to LaTeX xcolor mapping
+ANSI_TO_LATEX = {
+    '30': 'black', '31': 'red', '32': 'green', '33': 'yellow',
+    '34': 'blue', '35': 'magenta', '36': 'cyan', '37': 'white',
+    '90': 'darkgray', '91': 'red!80!white', '92': 'green!80!white',
+    '93': 'yellow!80!white', '94': 'blue!80!white',
+    '95': 'magenta!80!white', '96': 'cyan!80!white', '97': 'lightgray',
+    # Bold variants (1;3x)
+    '1;30': 'black', '1;31': 'red', '1;32': 'green', '1;33': 'yellow',
+    '1;34': 'blue', '1;35': 'magenta', '1;36': 'cyan', '1;37': 'white',
+}
+
+# 256-color palette, system colors 0-15 (named xcolor equivalents)
+# Format: 38;5;XXX or 48;5;XXX (foreground/background)
+COLOR_256_TO_LATEX = {
+    '0': 'black', '1': 'red', '2': 'green', '3': 'yellow',
+    '4': 'blue', '5': 'magenta', '6': 'cyan', '7': 'white',
+    '8': 'darkgray', '9': 'red!80', '10': 'green!80', '11': 'yellow!80',
+    '12': 'blue!80', '13': 'magenta!80', '14': 'cyan!80', '15': 'lightgray',
+}
+
+# Channel levels of the xterm 6x6x6 color cube (colors 16-231)
+XTERM_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+
+def _xterm256_to_xcolor(n: int) -> str:
+    """
+    Map a 256-color palette index to an xcolor color.
+
+    0-15 use the named colors above, 16-231 decode the 6x6x6 RGB cube
+    (16 + 36r + 6g + b) and 232-255 the grayscale ramp (8 + 10k).
+    Cube and ramp colors are returned as an ``[RGB]{r,g,b}`` model spec.
+    """
+    if n < 16:
+        return COLOR_256_TO_LATEX[str(n)]
+    if n < 232:
+        n -= 16
+        r, g, b = (XTERM_CUBE_LEVELS[n // 36], XTERM_CUBE_LEVELS[(n // 6) % 6],
+                   XTERM_CUBE_LEVELS[n % 6])
+    else:
+        r = g = b = 8 + 10 * (n - 232)
+    return f'[RGB]{{{r},{g},{b}}}'
+
+
+# Full palette, built once at import and keyed by the code as it appears in
+# the escape sequence, so a lookup needs no int() parsing or range checks
+XTERM_256_TO_LATEX = {str(n): _xterm256_to_xcolor(n) for n in range(256)}
+
+# Complete SGR code -> color state table for the conversion loop.
+# None means reset; codes not listed leave the current color unchanged.
+SGR_TO_LATEX = {
+    '0': None,
+    **ANSI_TO_LATEX,
+    **{f'38;5;{n}': color for n, color in XTERM_256_TO_LATEX.items()},
+}
+
+# Marker for codes that leave the current color unchanged
+KEEP_COLOR = object()
+
+
+@lru_cache(maxsize=1024)
+def _resolve_sgr_code(code: str):
+    """
+    Resolve an SGR code missing from SGR_TO_LATEX, once per distinct code.
+
+    Args:
+        code: SGR parameter list, e.g. '38;5;196;1' or '48;5;0'
+
+    Returns:
+        xcolor color for the code, or KEEP_COLOR if it doesn't set one
+    """
+    # 256-color foreground combined with further parameters (38;5;XXX;...)
+    if code.startswith('38;5;'):
+        return XTERM_256_TO_LATEX.get(code.split(';')[2], KEEP_COLOR)
+    # Ignore backgrounds (48;5;XXX - could add background support later)
+    # and unrecognized codes
+    return KEEP_COLOR
+
 
 class PlotextChart:
     """
@@ -36,6 +161,12 @@ class PlotextChart:
         PlotextChart(ansi_output, size='small')
     """
 
+    __slots__ = ('ansi_output', 'size', '_html_cache', '_latex_cache')
+
+    # Shared by all charts; the converter settings never change per chart.
+    # Created on first HTML render so PDF-only runs never import ansi2html
+    _HTML_CONV = None
+
     def __init__(
         self,
         ansi_output: str,
@@ -50,7 +181,23 @@ class PlotextChart:
         """
         self.ansi_output = ansi_output
         self.size = size
-        self.html_converter = Ansi2HTMLConverter(inline=True, scheme='ansi2html')
+        # Converted output as (source ANSI, result); recomputed only if
+        # ansi_output is reassigned
+        self._html_cache = None
+        self._latex_cache = None
+
+    @classmethod
+    def _get_html_converter(cls):
+        """Return the shared ANSI → HTML converter, importing ansi2html on first use."""
+        if cls._HTML_CONV is None:
+            from ansi2html import Ansi2HTMLConverter
+            cls._HTML_CONV = Ansi2HTMLConverter(inline=True, scheme='ansi2html')
+        return cls._HTML_CONV
+
+    @property
+    def html_converter(self):
+        """Shared ANSI → HTML converter (kept for backwards compatibility)."""
+        return self._get_html_converter()
 
     def _repr_html_(self) -> str:
         """
@@ -68,8 +215,15 @@ class PlotextChart:
         Returns:
             HTML string with inline CSS for ANSI colors
         """
-        # Convert ANSI to HTML with inline styles
-        html_output = self.html_converter.convert(self.ansi_output, full=False)
+        # Convert ANSI to HTML with inline styles (once per ANSI string)
+        if self._html_cache is None or self._html_cache[0] != self.ansi_output:
+            if '\x1b' not in self.ansi_output:
+                # No escape codes: the converter would only escape &, < and >
+                html_output = html.escape(self.ansi_output, quote=False)
+            else:
+                html_output = self._get_html_converter().convert(self.ansi_output, full=False)
+            self._html_cache = (self.ansi_output, html_output)
+        html_output = self._html_cache[1]
 
         # Wrap in pre with Configured font
         return f'''<pre style="
@@ -86,20 +240,47 @@ class PlotextChart:
         Returns:
             LaTeX verbatim environment with ANSI colors converted to xcolor
         """
-        # Convert ANSI to LaTeX
-        latex_output = self._ansi_to_latex(self.ansi_output)
+        # Convert ANSI to LaTeX (once per ANSI string)
+        if self._latex_cache is None or self._latex_cache[0] != self.ansi_output:
+            self._latex_cache = (self.ansi_output, self._ansi_to_latex(self.ansi_output))
+        latex_output = self._latex_cache[1]
+
+        # Wrap in the Verbatim environment (unknown sizes render as medium)
+        prefix, suffix = LATEX_WRAPPERS.get(self.size, LATEX_WRAPPERS['medium'])
+        return prefix + latex_output + suffix
+
+    @classmethod
+    def render_many_latex(
+        cls,
+        ansi_outputs: Iterable[str],
+        size: Literal['tiny', 'small', 'medium', 'large'] = 'medium'
+    ) -> List[str]:
+        """
+        Convert several charts to LaTeX in one call.
 
-        # Get font size command
-        font_size = LATEX_FONT_SIZES.get(self.size, r'\normalsize')
+        Args:
+            ansi_outputs: Raw ANSI outputs from plotext.build()
+            size: Font size applied to every chart (tiny/small/medium/large)
 
-        # Wrap in Verbatim environment with typewriter font
-        # Using raw strings and concatenation to avoid f-string escaping issues
-        result = r'\begin{Verbatim}[commandchars=\\\{\}]' + '\n'
-        result += font_size + '\n'
-        result += r'\ttfamily' + '\n'
-        result += latex_output + '\n'
-        result += r'\end{Verbatim}'
-        return result
+        Returns:
+            LaTeX verbatim environments, in input order
+        """
+        to_latex = cls._repr_latex_
+        return [to_latex(cls(ansi_output, size=size)) for ansi_output in ansi_outputs]
+
+    @classmethod
+    def render_many_html(cls, ansi_outputs: Iterable[str]) -> List[str]:
+        """
+        Convert several charts to HTML in one call.
+
+        Args:
+            ansi_outputs: Raw ANSI outputs from plotext.build()
+
+        Returns:
+            HTML strings with inline CSS for ANSI colors, in input order
+        """
+        to_html = cls.to_html
+        return [to_html(cls(ansi_output)) for ansi_output in ansi_outputs]
 
     def _ansi_to_latex(self, text: str) -> str:
         """
@@ -111,75 +292,77 @@ class PlotextChart:
         Returns:
             LaTeX formatted text with textcolor commands
         """
-        import re
-
-        # ANSI color code to LaTeX xcolor mapping
-        ANSI_TO_LATEX = {
-            '30': 'black', '31': 'red', '32': 'green', '33': 'yellow',
-            '34': 'blue', '35': 'magenta', '36': 'cyan', '37': 'white',
-            '90': 'darkgray', '91': 'red!80!white', '92': 'green!80!white',
-            '93': 'yellow!80!white', '94': 'blue!80!white',
-            '95': 'magenta!80!white', '96': 'cyan!80!white', '97': 'lightgray',
-            # Bold variants (1;3x)
-            '1;30': 'black', '1;31': 'red', '1;32': 'green', '1;33': 'yellow',
-            '1;34': 'blue', '1;35': 'magenta', '1;36': 'cyan', '1;37': 'white',
-        }
-
-        # 256-color palette mapping (common colors used by plotext themes)
-        # Format: 38;5;XXX or 48;5;XXX (foreground/background)
-        COLOR_256_TO_LATEX = {
-            '0': 'black', '1': 'red', '2': 'green', '3': 'yellow',
-            '4': 'blue', '5': 'magenta', '6': 'cyan', '7': 'white',
-            '8': 'darkgray', '9': 'red!80', '10': 'green!80', '11': 'yellow!80',
-            '12': 'blue!80', '13': 'magenta!80', '14': 'cyan!80', '15': 'lightgray',
-            # Extended colors (approximate xcolor equivalents)
-            '16': 'black', '17': 'blue!20!black', '18': 'blue!40!black',
-            '19': 'blue!60!black', '20': 'blue!80!black', '21': 'blue',
-            '196': 'red', '226': 'yellow', '46': 'green', '51': 'cyan',
-            '201': 'magenta', '208': 'orange', '220': 'yellow!80',
-        }
-
-        # Parse ANSI codes FIRST (before escaping LaTeX characters)
-        # Split by ANSI escape sequences: \033[XXm or \x1b[XXm
-        result = []
+        # Plain text (no escape codes) only needs LaTeX escaping
+        if '\x1b[' not in text:
+            return _escape_latex(text)
+
+        # Drop the (ignored) background codes, then escape. Fragments are
+        # streamed straight into the buffer; no list of parts or results is
+        # ever built
+        text = _escape_latex(ANSI_BACKGROUND_RE.sub('', text))
+        buf = io.StringIO()
+        buf.writelines(self._latex_fragments(text))
+        return buf.getvalue()
+
+    def _latex_fragments(self, text: str) -> Iterator[str]:
+        """
+        Yield LaTeX fragments for LaTeX-escaped ANSI text.
+
+        Escaping before parsing is safe: ANSI sequences (ESC [ digits ; m)
+        contain none of the escaped characters, so the codes survive untouched.
+
+        Args:
+            text: ANSI formatted text, already LaTeX-escaped
+
+        Yields:
+            Plain or textcolor-wrapped text, one fragment per colour run
+        """
         current_color = None
-        parts = re.split(r'\x1b\[([0-9;]+)m', text)
-
-        for i, part in enumerate(parts):
-            if i % 2 == 0:  # Text content
-                if part:
-                    # Escape LaTeX special characters in the text content
-                    escaped = part
-                    escaped = escaped.replace('\\', r'\textbackslash{}')
-                    escaped = escaped.replace('{', r'\{')
-                    escaped = escaped.replace('}', r'\}')
-                    escaped = escaped.replace('_', r'\_')
-                    escaped = escaped.replace('^', r'\textasciicircum{}')
-                    escaped = escaped.replace('~', r'\textasciitilde{}')
-                    escaped = escaped.replace('#', r'\#')
-                    escaped = escaped.replace('$', r'\$')
-                    escaped = escaped.replace('%', r'\%')
-                    escaped = escaped.replace('&', r'\&')
-
-                    if current_color:
-                        result.append(f'\\textcolor{{{current_color}}}{{{escaped}}}')
-                    else:
-                        result.append(escaped)
-            else:  # ANSI code
-                if part == '0' or part == '':  # Reset
-                    current_color = None
-                # Check for 256-color format: 38;5;XXX (foreground) or 48;5;XXX (background)
-                elif part.startswith('38;5;'):
-                    color_num = part.split(';')[2]
-                    current_color = COLOR_256_TO_LATEX.get(color_num, f'black!{int(color_num)*100//255}!white')
-                elif part.startswith('48;5;'):
-                    # Background color - skip for now (could add background support later)
-                    pass
-                elif part in ANSI_TO_LATEX:
-                    current_color = ANSI_TO_LATEX[part]
-                # Ignore unrecognized codes
-
-        return ''.join(result)
+        # Consecutive text in the same colour is collected into one run and
+        # emitted under a single \textcolor (codes that don't change the
+        # colour, e.g. backgrounds, don't split the text)
+        run = []
+        run_color = None
+        pos = 0
+
+        # Walk the escape sequences (\033[XXm or \x1b[XXm) in place; a final
+        # None flushes the text after the last code
+        for match in chain(ANSI_ESCAPE_RE.finditer(text), (None,)):
+            # Text content up to this code, in the color set by the previous one
+            end = match.start() if match else len(text)
+            if end > pos:
+                if run and current_color != run_color:
+                    yield self._latex_run(run_color, run)
+                    run = []
+                run_color = current_color
+                run.append(text[pos:end])
+
+            if match is None:
+                break
+            pos = match.end()
+            code = match.group(1)
+
+            # Reset, basic and 256-color foreground codes: one table lookup
+            if code in SGR_TO_LATEX:
+                current_color = SGR_TO_LATEX[code]
+            # Anything else is parsed once per distinct code, then cached
+            else:
+                color = _resolve_sgr_code(code)
+                if color is not KEEP_COLOR:
+                    current_color = color
+
+        if run:
+            yield self._latex_run(run_color, run)
+
+    @staticmethod
+    def _latex_run(color: Optional[str], run: list) -> str:
+        """Render one colour run, wrapping it in textcolor when colored."""
+        text_run = ''.join(run)
+        if not color:
+            return text_run
+        # Named colors need braces; model specs ([RGB]{...}) carry their own
+        spec = color if color[0] == '[' else f'{{{color}}}'
+        return f'\\textcolor{spec}{{{text_run}}}'
 
 
 def plotext_chart(
@@ -4,13 +4,232 @@ Excel reader with table detection.
 Detects multiple tables within a single Excel sheet.
 """
 
+import os
+import re
+import pickle
+import hashlib
+import io
+import textwrap
+import time
+import zipfile
+from datetime import date, datetime
+from functools import wraps
+import numpy as np
 import pandas as pd
 import openpyxl
-from typing import List, Dict, Tuple, Optional, NamedTuple
+from typing import Iterator, List, Dict, Tuple, Optional, NamedTuple
+from .config import Config
+
+try:
+    # Optional: calamine (Rust) parses workbooks several times faster than openpyxl
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+ENGINES = ('calamine', 'openpyxl')
+
+# Bump when the layout of cached results changes
+CACHE_VERSION = 3
+
+# Key-value regions up to this many rows are built column-wise (see
+# ExcelReader._key_value_frame); above it the row-wise build is faster
+KV_COLUMNWISE_MAX_ROWS = 2000
+
+INT32_MIN, INT32_MAX = np.iinfo(np.int32).min, np.iinfo(np.int32).max
+
+# Active sheet index in an XLSX workbook (<workbookView activeTab="N"/>)
+ACTIVE_TAB_RE = re.compile(rb'<(?:\w+:)?workbookView\b[^>]*?\bactiveTab="(\d+)"')
+
+
+def _prune_cache(cache_dir: str):
+    """
+    Keep the disk cache bounded (Config.CACHE_MAX_AGE_DAYS / CACHE_MAX_BYTES).
+
+    Entries are dropped by last use (file mtime, refreshed on every hit):
+    first those older than the age limit, then the oldest until the total
+    size is under the limit.
+    """
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith('.pkl'):
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue  # Removed concurrently
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+    entries.sort(reverse=True)  # Most recently used first
+
+    cutoff = time.time() - Config.CACHE_MAX_AGE_DAYS * 86400
+    total = 0
+    for mtime, size, path in entries:
+        total += size
+        if mtime < cutoff or total > Config.CACHE_MAX_BYTES:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def _disk_cached(func):
+    """
+    Cache results derived from an Excel file on disk (see Config.CACHE_DIR).
+
+    The first argument is the file path or an ExcelReader. Results are keyed
+    on the file's path, modification time and size plus the call arguments,
+    so editing the workbook invalidates them. Adds a ``cache`` keyword:
+    pass cache=False to bypass the cache (Config.CACHE_DIR = None disables
+    it globally).
+    """
+    @wraps(func)
+    def wrapper(source, *args, cache: bool = True, **kwargs):
+        if not cache or not Config.CACHE_DIR:
+            return func(source, *args, **kwargs)
+
+        filepath = os.path.abspath(getattr(source, 'filepath', source))
+        # A reader's results come from the file as it was when opened, so key
+        # them on that version, not on whatever is on disk now
+        stat = getattr(source, '_file_stat', None)
+        if stat is None:
+            try:
+                stat = os.stat(filepath)
+            except OSError:
+                return func(source, *args, **kwargs)
+
+        key = repr((
+            CACHE_VERSION, func.__qualname__, filepath, stat.st_mtime_ns, stat.st_size,
+            getattr(source, 'engine', None), args, sorted(kwargs.items()),
+        ))
+        cache_dir = os.path.expanduser(Config.CACHE_DIR)
+        cache_file = os.path.join(
+            cache_dir, hashlib.blake2b(key.encode(), digest_size=16).hexdigest() + '.pkl'
+        )
+
+        try:
+            with open(cache_file, 'rb') as f:
+                result = pickle.load(f)
+        except FileNotFoundError:
+            pass
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            pass  # Truncated entry or one pickled by an incompatible version: recompute
+        else:
+            try:
+                os.utime(cache_file)  # Mark as recently used for _prune_cache
+            except OSError:
+                pass
+            return result
+
+        result = func(source, *args, **kwargs)
+        tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+            _prune_cache(cache_dir)
+        except (OSError, pickle.PicklingError):
+            # Caching is best-effort (e.g. read-only home directory, disk full);
+            # don't leave a partial file outside the pruned *.pkl entries
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+        return result
+    return wrapper
+
+
+def _calamine_value(value):
+    """
+    Convert a calamine cell value to what openpyxl (data_only) returns.
+
+    calamine reports empty cells as '', every number as float and
+    date-only cells as date; openpyxl gives None, int for whole numbers
+    and datetime.
+    """
+    if value == '':
+        return None
+    if type(value) is float and value.is_integer():
+        return int(value)
+    if type(value) is date:
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
+def _active_sheet_index(source) -> int:
+    """Index of the active sheet in an XLSX file, given as path or file object (0 if unknown)."""
+    try:
+        with zipfile.ZipFile(source) as archive:
+            match = ACTIVE_TAB_RE.search(archive.read('xl/workbook.xml'))
+    except (zipfile.BadZipFile, KeyError, OSError):
+        return 0
+    return int(match.group(1)) if match else 0
+
+
+def _cell_value(rows: List[list], row_idx: int, col_idx: int):
+    """Value at a 1-indexed cell, None outside the used range (like ws.cell)."""
+    if row_idx <= len(rows):
+        row = rows[row_idx - 1]
+        if col_idx <= len(row):
+            return row[col_idx - 1]
+    return None
+
+
+def _row_values(rows: List[list], row_idx: int, start_col: int, end_col: int) -> list:
+    """Values of one row across a 1-indexed column span, padded with None."""
+    values = rows[row_idx - 1][start_col - 1:end_col] if row_idx <= len(rows) else []
+    missing = end_col - start_col + 1 - len(values)
+    return values + [None] * missing if missing > 0 else values
+
+
+def _count_strings(values: list) -> int:
+    """Number of str values. Counting types runs in C, unlike per-value isinstance."""
+    return list(map(type, values)).count(str)
+
+
+def _count_numbers(values: list) -> int:
+    """Number of int/float values (bool included, as with isinstance)."""
+    types = list(map(type, values))
+    return types.count(int) + types.count(float) + types.count(bool)
+
+
+def _downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Store 64-bit numeric columns as int32/float32 where that loses nothing.
+
+    Integer columns within the int32 range become int32; float columns whose
+    every value survives a float32 round trip become float32. Other columns
+    are left as they are. Modifies df in place and returns it.
+    """
+    for position, (_, col) in enumerate(df.items()):
+        dtype = col.dtype
+        if not isinstance(dtype, np.dtype) or dtype.itemsize <= 4 or col.empty:
+            continue
+        if dtype.kind in 'iu':
+            if INT32_MIN <= col.min() and col.max() <= INT32_MAX:
+                df.isetitem(position, col.astype(np.int32))
+        elif dtype.kind == 'f':
+            # Values outside the float32 range overflow to inf and fail the check
+            with np.errstate(over='ignore'):
+                narrow = col.astype(np.float32)
+            if ((narrow.astype(dtype) == col) | col.isna()).all():
+                df.isetitem(position, narrow)
+    return df
+
+
+def _region_values(rows: List[list], region: 'TableRegion', nrows: Optional[int] = None) -> List[list]:
+    """
+    Values of a table region, one list per row (padded like _row_values).
+
+    If nrows is given, only the region's first nrows rows are read.
+    """
+    end_row = region.end_row if nrows is None else min(region.end_row, region.start_row + nrows - 1)
+    return [_row_values(rows, row_idx, region.start_col, region.end_col)
+            for row_idx in range(region.start_row, end_row + 1)]
 
 
 class TableRegion:
     """Represents a detected table region in an Excel sheet."""
+
+    __slots__ = ('start_row', 'end_row', 'start_col', 'end_col', 'name', 'title_row')
     
     def __init__(self, start_row: int, end_row: int, start_col: int, end_col: int, name: str = "", title_row: Optional[int] = None):
         self.start_row = start_row
@@ -34,17 +253,118 @@ class ExcelReader:
         reader = ExcelReader('data.xlsx')
         tables = reader.detect_tables('Sheet1')
         df = reader.read_table(tables[0])
+
+    Or as a context manager:
+        with ExcelReader('data.xlsx') as reader:
+            tables = reader.detect_tables('Sheet1')
     """
     
-    def __init__(self, filepath: str):
-        """Initialize reader with Excel file path."""
+    def __init__(self, filepath: str, engine: str = 'calamine'):
+        """
+        Initialize reader with Excel file path.
+
+        Args:
+            filepath: Path to Excel file
+            engine: 'calamine' (default, falls back to openpyxl when
+                    python-calamine is not installed) or 'openpyxl'
+        """
+        if engine not in ENGINES:
+            raise ValueError(f"engine must be one of {ENGINES}, got {engine!r}")
+        if engine == 'calamine' and CalamineWorkbook is None:
+            engine = 'openpyxl'
+
         self.filepath = filepath
-        self.workbook = openpyxl.load_workbook(filepath, data_only=True)
+        self.engine = engine
+        self._load()
+
+    def _load(self):
+        """Open the workbook and start with empty per-sheet caches."""
+        # Read the file into memory once: both engines parse sheets lazily,
+        # so this way the reader holds no file handle (Excel can save the
+        # file) and sheets parsed later still reflect the file as opened
+        with open(self.filepath, 'rb') as f:
+            # Stat of exactly the bytes read; keys this reader's disk cache entries
+            self._file_stat = os.fstat(f.fileno())
+            content = f.read()
+
+        if self.engine == 'calamine':
+            self.workbook = CalamineWorkbook.from_filelike(io.BytesIO(content))
+            # calamine doesn't expose the active tab; read it from the archive
+            self._active_index = _active_sheet_index(io.BytesIO(content))
+        else:
+            # Cells are only ever read, so the lightweight read-only mode is safe
+            self.workbook = openpyxl.load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+
+        # Sheet name -> cell values (list of rows from A1), parsed on first use
+        self._sheets: Dict[str, List[list]] = {}
+        # Detected regions: sheet name -> key-value tables,
+        # (sheet name, min_rows) -> tables
+        self._kv_cache: Dict[str, List[TableRegion]] = {}
+        self._tbl_cache: Dict[Tuple[str, int], List[TableRegion]] = {}
+
+    def reload(self):
+        """Re-read the workbook from disk, dropping parsed sheets and detected tables."""
+        self._load()
+
+    def close(self):
+        """
+        Close the reader.
+
+        The file is read into memory when the reader is created, so nothing
+        is held open; kept so readers work as context managers. The reader
+        stays fully usable afterwards.
+        """
+
+    def __enter__(self) -> 'ExcelReader':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
     
     @property
     def sheet_names(self) -> List[str]:
         """Get list of sheet names."""
+        if self.engine == 'calamine':
+            return self.workbook.sheet_names
         return self.workbook.sheetnames
+
+    def _get_sheet(self, sheet_name: str) -> List[list]:
+        """
+        Get all cell values of a sheet as a dense list of rows.
+
+        Row i / column j of the sheet (1-indexed) is ``rows[i-1][j-1]``;
+        empty cells are None and all rows have the same length. Parsed once
+        per sheet and cached.
+        """
+        rows = self._sheets.get(sheet_name)
+        if rows is None:
+            if sheet_name not in self.sheet_names:
+                raise KeyError(f"Worksheet {sheet_name} does not exist.")
+
+            if self.engine == 'calamine':
+                sheet = self.workbook.get_sheet_by_name(sheet_name)
+                rows = [[_calamine_value(v) for v in row]
+                        for row in sheet.to_python(skip_empty_area=False)]
+            else:
+                ws = self.workbook[sheet_name]
+                rows = [list(row) for row in ws.iter_rows(values_only=True)]
+
+            # Read-only openpyxl sizes rows from the sheet's <dimension>, which
+            # may be missing or wrong; pad so every row spans the same columns
+            width = max(map(len, rows), default=0)
+            for row in rows:
+                if len(row) < width:
+                    row.extend([None] * (width - len(row)))
+            self._sheets[sheet_name] = rows
+        return rows
+
+    def _active_sheet_name(self) -> str:
+        """Name of the sheet that was active when the workbook was saved."""
+        if self.engine == 'calamine':
+            names = self.sheet_names
+            index = self._active_index
+            return names[index] if index < len(names) else names[0]
+        return self.workbook.active.title
     
     def detect_key_value_tables(self, sheet_name: str) -> List[TableRegion]:
         """
@@ -65,30 +385,41 @@ class ExcelReader:
         Returns:
             List of TableRegion objects
         """
-        ws = self.workbook[sheet_name]
-        tables = []
+        regions = self._kv_cache.get(sheet_name)
+        if regions is None:
+            regions = self._kv_cache[sheet_name] = list(self._iter_key_value_regions(sheet_name))
+        return list(regions)
+
+    def _iter_key_value_regions(self, sheet_name: str) -> Iterator[TableRegion]:
+        """
+        Scan a sheet once, yielding each key-value region as soon as it closes.
+
+        See detect_key_value_tables for the detection rules.
+        """
+        rows = self._get_sheet(sheet_name)
+        found = 0
         
         current_title = None
         current_title_row = None
         current_start = None
         current_end = None
         
-        for row_idx in range(1, ws.max_row + 1):
-            col_a = ws.cell(row_idx, 1).value
-            col_b = ws.cell(row_idx, 2).value
+        for row_idx in range(1, len(rows) + 1):
+            col_a, col_b = _row_values(rows, row_idx, 1, 2)
             
             # Check if this is a title row (A has text, B is empty)
             if col_a is not None and col_b is None:
                 # Save previous table if exists
                 if current_start is not None:
-                    tables.append(TableRegion(
+                    found += 1
+                    yield TableRegion(
                         start_row=current_start,
                         end_row=current_end,
                         start_col=1,
                         end_col=3,
-                        name=current_title or f"Table_{len(tables)+1}",
+                        name=current_title or f"Table_{found}",
                         title_row=current_title_row
-                    ))
+                    )
                 
                 # Start new table
                 current_title = str(col_a).strip()
@@ -106,29 +437,29 @@ class ExcelReader:
             elif col_a is None and col_b is None:
                 # If we have accumulated data, save it
                 if current_start is not None and current_end is not None:
-                    tables.append(TableRegion(
+                    found += 1
+                    yield TableRegion(
                         start_row=current_start,
                         end_row=current_end,
                         start_col=1,
                         end_col=3,
-                        name=current_title or f"Table_{len(tables)+1}",
+                        name=current_title or f"Table_{found}",
                         title_row=current_title_row
-                    ))
+                    )
                     current_start = None
                     current_end = None
         
         # Don't forget the last table
         if current_start is not None and current_end is not None:
-            tables.append(TableRegion(
+            found += 1
+            yield TableRegion(
                 start_row=current_start,
                 end_row=current_end,
                 start_col=1,
                 end_col=3,
-                name=current_title or f"Table_{len(tables)+1}",
+                name=current_title or f"Table_{found}",
                 title_row=current_title_row
-            ))
-        
-        return tables
+            )
     
     def detect_tables(self, sheet_name: str, min_rows: int = 2) -> List[TableRegion]:
         """
@@ -141,74 +472,61 @@ class ExcelReader:
         Returns:
             List of TableRegion objects
         """
-        ws = self.workbook[sheet_name]
-        tables = []
-        
-        # Get all cells with values
-        data_cells = []
-        for row_idx, row in enumerate(ws.iter_rows(values_only=True), 1):
-            for col_idx, value in enumerate(row, 1):
-                if value is not None:
-                    data_cells.append((row_idx, col_idx))
-        
-        if not data_cells:
+        key = (sheet_name, min_rows)
+        regions = self._tbl_cache.get(key)
+        if regions is None:
+            regions = self._tbl_cache[key] = self._find_tables(sheet_name, min_rows)
+        return list(regions)
+
+    def _find_tables(self, sheet_name: str, min_rows: int) -> List[TableRegion]:
+        """Scan a sheet for contiguous data regions (see detect_tables)."""
+        rows = self._get_sheet(sheet_name)
+        if not rows:
             return []
-        
-        # Find contiguous regions (simple heuristic: separated by 2+ empty rows)
-        data_cells.sort()
-        
-        current_region = {
-            'start_row': data_cells[0][0],
-            'end_row': data_cells[0][0],
-            'start_col': min(c for r, c in data_cells),
-            'end_col': max(c for r, c in data_cells),
-        }
-        
-        for i in range(1, len(data_cells)):
-            prev_row = data_cells[i-1][0]
-            curr_row = data_cells[i][0]
-            
-            # If gap is > 1 row, start new region
-            if curr_row - prev_row > 1:
-                # Save current region if it has enough rows
-                if current_region['end_row'] - current_region['start_row'] + 1 >= min_rows:
-                    # Try to find table name (first row, first column)
-                    name = ws.cell(current_region['start_row'], current_region['start_col']).value
-                    if name:
-                        name = str(name).strip()
-                    
-                    tables.append(TableRegion(
-                        start_row=current_region['start_row'],
-                        end_row=current_region['end_row'],
-                        start_col=current_region['start_col'],
-                        end_col=current_region['end_col'],
-                        name=name or f"Table_{len(tables)+1}"
-                    ))
-                
-                # Start new region
-                current_region = {
-                    'start_row': curr_row,
-                    'end_row': curr_row,
-                    'start_col': current_region['start_col'],
-                    'end_col': current_region['end_col'],
-                }
-            else:
-                current_region['end_row'] = curr_row
-        
-        # Don't forget the last region
-        if current_region['end_row'] - current_region['start_row'] + 1 >= min_rows:
-            name = ws.cell(current_region['start_row'], current_region['start_col']).value
+
+        # Rows holding any value (_get_sheet pads rows to one width); list.count
+        # scans each row in C without building a per-cell mask
+        width = len(rows[0])
+        data_rows = np.flatnonzero([row.count(None) != width for row in rows]) + 1
+        if not data_rows.size:
+            return []
+
+        # Every region spans the sheet's full used column range. Only its
+        # bounds matter, so scan columns inwards from both edges and stop at
+        # the first used one
+        data = [rows[row_idx - 1] for row_idx in data_rows.tolist()]
+
+        def column_used(col: int) -> bool:
+            return any(row[col] is not None for row in data)
+
+        start_col = next(col for col in range(width) if column_used(col)) + 1
+        end_col = next(col for col in reversed(range(width)) if column_used(col)) + 1
+
+        # Find contiguous regions (simple heuristic: separated by 2+ empty rows):
+        # a new region starts wherever the gap to the previous data row is > 1
+        breaks = np.flatnonzero(np.diff(data_rows) > 1) + 1
+        region_starts = data_rows[np.r_[0, breaks]].tolist()
+        region_ends = data_rows[np.r_[breaks - 1, data_rows.size - 1]].tolist()
+
+        tables = []
+        for start_row, end_row in zip(region_starts, region_ends):
+            # Skip regions without enough rows
+            if end_row - start_row + 1 < min_rows:
+                continue
+
+            # Try to find table name (first row, first column)
+            name = _cell_value(rows, start_row, start_col)
             if name:
                 name = str(name).strip()
-            
+
             tables.append(TableRegion(
-                start_row=current_region['start_row'],
-                end_row=current_region['end_row'],
-                start_col=current_region['start_col'],
-                end_col=current_region['end_col'],
+                start_row=start_row,
+                end_row=end_row,
+                start_col=start_col,
+                end_col=end_col,
                 name=name or f"Table_{len(tables)+1}"
             ))
-        
+
         return tables
     
     def detect_header_row(self, sheet_name: str, region: TableRegion) -> Optional[int]:
@@ -227,42 +545,39 @@ class ExcelReader:
         - Headers often have unique values (no duplicates)
         - First row is most common header location
         """
-        ws = self.workbook[sheet_name]
+        rows = self._get_sheet(sheet_name)
+
+        # Common case: a first row of all strings is the header, whatever follows
+        first_row = _row_values(rows, region.start_row, region.start_col, region.end_col)
+        if _count_strings(first_row) == len(first_row):
+            return region.start_row
 
         # Check first few rows for header candidates
         max_check_rows = min(3, region.end_row - region.start_row + 1)
 
         for offset in range(max_check_rows):
             row_idx = region.start_row + offset
-            row_values = [ws.cell(row_idx, col_idx).value
-                         for col_idx in range(region.start_col, region.end_col + 1)]
+            row_values = _row_values(rows, row_idx, region.start_col, region.end_col)
 
             # Check if this row looks like headers
             # 1. All values should be non-None
-            if not all(v is not None for v in row_values):
+            if None in row_values:
                 continue
 
+            # Count string values in current row
+            string_count = _count_strings(row_values)
+
             # 2. Check next row to see if it's data (numeric)
             if row_idx < region.end_row:
-                next_row_values = [ws.cell(row_idx + 1, col_idx).value
-                                  for col_idx in range(region.start_col, region.end_col + 1)]
+                next_row_values = _row_values(rows, row_idx + 1, region.start_col, region.end_col)
 
                 # Count numeric values in next row
-                numeric_count = sum(1 for v in next_row_values
-                                  if isinstance(v, (int, float)) and v is not None)
-
-                # Count string values in current row
-                string_count = sum(1 for v in row_values
-                                 if isinstance(v, str))
+                numeric_count = _count_numbers(next_row_values)
 
                 # If current row is mostly strings and next row has numbers, this is likely header
                 if string_count >= len(row_values) * 0.5 and numeric_count > 0:
                     return row_idx
 
-            # If this is the first row and all strings, assume it's header
-            if offset == 0 and all(isinstance(v, str) for v in row_values):
-                return row_idx
-
         # Default: assume first row is header if it exists
         return region.start_row if region.end_row > region.start_row else None
 
@@ -278,16 +593,10 @@ class ExcelReader:
         Returns:
             pandas DataFrame
         """
-        ws = self.workbook.active
+        rows = self._get_sheet(self._active_sheet_name())
 
         # Extract data from region
-        data = []
-        for row_idx in range(region.start_row, region.end_row + 1):
-            row_data = []
-            for col_idx in range(region.start_col, region.end_col + 1):
-                cell = ws.cell(row_idx, col_idx)
-                row_data.append(cell.value)
-            data.append(row_data)
+        data = _region_values(rows, region)
 
         if not data:
             return pd.DataFrame()
@@ -299,9 +608,9 @@ class ExcelReader:
             second_row = data[1] if len(data) > 1 else []
 
             # Count string vs numeric in first row
-            first_strings = sum(1 for v in first_row if isinstance(v, str))
+            first_strings = _count_strings(first_row)
             # Count numeric in second row
-            second_numeric = sum(1 for v in second_row if isinstance(v, (int, float)) and v is not None)
+            second_numeric = _count_numbers(second_row)
 
             # If first row is mostly strings and second has numbers, use first as header
             if first_strings >= len(first_row) * 0.5 and second_numeric > 0:
@@ -317,31 +626,47 @@ class ExcelReader:
 
         return df
     
-    def read_key_value_region(self, sheet_name: str, region: TableRegion) -> pd.DataFrame:
+    def read_key_value_region(self, sheet_name: str, region: TableRegion,
+                              nrows: Optional[int] = None,
+                              dtype_downcast: bool = False) -> pd.DataFrame:
         """
         Read a key-value table region.
         
         Args:
             sheet_name: Sheet name
             region: TableRegion object
+            nrows: Read only the first nrows rows of the region (None = all),
+                   e.g. for previews
+            dtype_downcast: If True, store numeric columns as int32/float32
+                            where no stored value changes (saves memory, but
+                            later arithmetic runs in 32-bit and can overflow
+                            or lose precision)
         
         Returns:
             DataFrame with first column as index
         """
-        ws = self.workbook[sheet_name]
+        rows = self._get_sheet(sheet_name)
         
         # Extract data from region
-        data = []
-        for row_idx in range(region.start_row, region.end_row + 1):
-            row_data = []
-            for col_idx in range(region.start_col, region.end_col + 1):
-                cell = ws.cell(row_idx, col_idx)
-                row_data.append(cell.value)
-            data.append(row_data)
-        
+        return self._key_value_frame(_region_values(rows, region, nrows), dtype_downcast)
+
+    @staticmethod
+    def _key_value_frame(data: List[list], dtype_downcast: bool = False) -> pd.DataFrame:
+        """Build a key-value DataFrame (first column as index) from region rows."""
         if not data:
             return pd.DataFrame()
         
+        # Common shape (detect_key_value_tables fixes columns A:C): small
+        # regions are built column-wise with the index in one shot, which
+        # beats DataFrame + set_index's fixed overhead; large ones are faster
+        # row-wise (one 2-D conversion), below
+        if len(data[0]) == 3 and len(data) <= KV_COLUMNWISE_MAX_ROWS:
+            params, values, units = (list(col) for col in zip(*data))
+            df = pd.DataFrame({'Value': values, 'Unit': units}, index=pd.Index(params))
+            if dtype_downcast:
+                _downcast_numeric(df)
+            return df
+        
         # Convert to DataFrame with proper column names
         if len(data[0]) == 2:
             df = pd.DataFrame(data, columns=['Parameter', 'Value'])
@@ -355,11 +680,15 @@ class ExcelReader:
             df.set_index('Parameter', inplace=True)
             df.index.name = None
         
+        if dtype_downcast:
+            _downcast_numeric(df)
+        
         return df
     
     def read_key_value_table(self, sheet_name: str, 
                             start_row: Optional[int] = None,
-                            end_row: Optional[int] = None) -> pd.DataFrame:
+                            end_row: Optional[int] = None,
+                            dtype_downcast: bool = False) -> pd.DataFrame:
         """
         Read a key-value table (common in assumptions sheets).
         
@@ -372,25 +701,25 @@ class ExcelReader:
             sheet_name: Name of sheet to read
             start_row: Starting row (1-indexed), None = auto-detect
             end_row: Ending row (1-indexed), None = auto-detect
+            dtype_downcast: If True, store numeric columns as int32/float32
+                            where no stored value changes (saves memory, but
+                            later arithmetic runs in 32-bit and can overflow
+                            or lose precision)
         
         Returns:
             DataFrame with parameter names as index
         """
-        ws = self.workbook[sheet_name]
+        rows = self._get_sheet(sheet_name)
         
         # Auto-detect if not specified
         if start_row is None:
             start_row = 1
         if end_row is None:
-            end_row = ws.max_row
+            end_row = len(rows)
         
-        # Read data
-        data = []
-        for row_idx in range(start_row, end_row + 1):
-            row = [ws.cell(row_idx, col).value for col in range(1, ws.max_column + 1)]
-            # Skip completely empty rows
-            if any(cell is not None for cell in row):
-                data.append(row)
+        # Read data (sheet rows are equally long), skipping completely empty rows
+        data = [row for row in rows[start_row - 1:end_row]
+                if any(cell is not None for cell in row)]
         
         if not data:
             return pd.DataFrame()
@@ -406,9 +735,13 @@ class ExcelReader:
             df.set_index(df.columns[0], inplace=True)
             df.index.name = None
         
+        if dtype_downcast:
+            _downcast_numeric(df)
+        
         return df
     
-    def read_all_tables(self, sheet_name: str, style: str = "assumptions", key_value: bool = True) -> List:
+    def read_all_tables(self, sheet_name: str, style: str = "assumptions", key_value: bool = True,
+                        cache: bool = True) -> List:
         """
         Detect and read all tables from a sheet, returning styled tables.
         
@@ -416,28 +749,42 @@ class ExcelReader:
             sheet_name: Name of sheet to read
             style: Style preset to apply
             key_value: If True, use key-value table detection
+            cache: If True, reuse tables cached on disk for the unchanged file
         
         Returns:
             List of tuples (table_name, FinancialTable object)
         """
         from .styles import FinancialTable
-        
+
+        # Only the data is cached; styling is applied fresh on every call
+        frames = self._read_all_frames(sheet_name, key_value, cache=cache)
+        return [(name, FinancialTable(df, style=style)) for name, df in frames]
+
+    @_disk_cached
+    def _read_all_frames(self, sheet_name: str, key_value: bool) -> List[Tuple[str, pd.DataFrame]]:
+        """Detect and read all tables from a sheet as (table_name, DataFrame) tuples."""
         if key_value:
-            regions = self.detect_key_value_tables(sheet_name)
-        else:
-            regions = self.detect_tables(sheet_name)
-        
+            return self._detect_and_read_key_value(sheet_name)
+
+        return [(region.name, self.read_table(region)) for region in self.detect_tables(sheet_name)]
+
+    def _detect_and_read_key_value(self, sheet_name: str) -> List[Tuple[str, pd.DataFrame]]:
+        """
+        Detect and read all key-value tables of a sheet in a single scan.
+
+        Each region's DataFrame is built as soon as the scan closes the region,
+        instead of detecting all regions first and reading each one afterwards.
+        """
+        rows = self._get_sheet(sheet_name)
+        cached = self._kv_cache.get(sheet_name)
+
+        regions = []
         tables = []
-        
-        for region in regions:
-            if key_value:
-                df = self.read_key_value_region(sheet_name, region)
-            else:
-                df = self.read_table(region)
-            
-            table = FinancialTable(df, style=style)
-            tables.append((region.name, table))
-        
+        for region in cached if cached is not None else self._iter_key_value_regions(sheet_name):
+            regions.append(region)
+            tables.append((region.name, self._key_value_frame(_region_values(rows, region))))
+
+        self._kv_cache[sheet_name] = regions
         return tables
 
 
@@ -457,12 +804,11 @@ def list_sheets(filepath: str) -> list:
         >>> print(sheets)
         ['Sheet1', 'Sheet2', 'Data']
     """
-    wb = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
-    sheet_names = wb.sheetnames
-    wb.close()
-    return sheet_names
+    with ExcelReader(filepath) as reader:
+        return list(reader.sheet_names)
 
 
+@_disk_cached
 def list_tables(filepath: str, glimpse: bool = False, max_rows: int = 3) -> Dict:
     """
     List all tables in an Excel file by sheet.
@@ -471,6 +817,8 @@ def list_tables(filepath: str, glimpse: bool = False, max_rows: int = 3) -> Dict
         filepath: Path to Excel file
         glimpse: If True, show headers and first N rows for each table
         max_rows: Number of rows to show in glimpse (default: 3)
+        cache: If True (default), reuse the result cached on disk while the
+               file is unchanged
 
     Returns:
         Dictionary mapping sheet names to list of table info dicts
@@ -487,39 +835,45 @@ def list_tables(filepath: str, glimpse: bool = False, max_rows: int = 3) -> Dict
         >>> # Or show more rows
         >>> tables = list_tables('data.xlsx', glimpse=True, max_rows=5)
     """
-    reader = ExcelReader(filepath)
-    result = {}
-
-    for sheet_name in reader.sheet_names:
-        # Try key-value table detection first (for assumptions/parameters)
-        regions = reader.detect_key_value_tables(sheet_name)
+    with ExcelReader(filepath) as reader:
+        result = {}
+
+        for sheet_name in reader.sheet_names:
+            # Try key-value table detection first (for assumptions/parameters)
+            regions = reader.detect_key_value_tables(sheet_name)
+
+            if not regions:
+                # Fallback to general table detection
+                regions = reader.detect_tables(sheet_name)
+
+            tables_info = []
+            for region in regions:
+                table_info = {
+                    'name': region.name,
+                    'rows': f"{region.start_row}-{region.end_row}",
+                    'cols': f"{region.start_col}-{region.end_col}",
+                    'size': f"{region.end_row - region.start_row + 1} rows × {region.end_col - region.start_col + 1} cols"
+                }
 
-        if not regions:
-            # Fallback to general table detection
-            regions = reader.detect_tables(sheet_name)
+                if glimpse:
+                    # Read only the rows shown in the preview
+                    df = reader.read_key_value_region(sheet_name, region, nrows=max_rows)
 
-        tables_info = []
-        for region in regions:
-            table_info = {
-                'name': region.name,
-                'rows': f"{region.start_row}-{region.end_row}",
-                'cols': f"{region.start_col}-{region.end_col}",
-                'size': f"{region.end_row - region.start_row + 1} rows × {region.end_col - region.start_col + 1} cols"
-            }
+                    # Add glimpse info
+                    table_info['columns'] = df.columns.tolist() if hasattr(df, 'columns') else []
+                    table_info['preview'] = df.head(max_rows)
 
-            if glimpse:
-                # Read table data
-                df = reader.read_key_value_region(sheet_name, region)
+                tables_info.append(table_info)
 
-                # Add glimpse info
-                table_info['columns'] = df.columns.tolist() if hasattr(df, 'columns') else []
-                table_info['preview'] = df.head(max_rows)
+            result[sheet_name] = tables_info
 
-            tables_info.append(table_info)
+        return result
 
-        result[sheet_name] = tables_info
 
-    return result
+def _print_preview(df: pd.DataFrame):
+    """Print a table preview indented under its entry, as a single write."""
+    # Indent every line, blank ones included, like the table listing
+    print(textwrap.indent(str(df), '     ', lambda line: True))
 
 
 def print_tables(filepath: str, glimpse: bool = False, max_rows: int = 3):
@@ -559,10 +913,7 @@ def print_tables(filepath: str, glimpse: bool = False, max_rows: int = 3):
 
             if glimpse and 'preview' in table_info:
                 print(f"\n     Preview:")
-                # Print with indentation
-                preview_str = str(table_info['preview'])
-                for line in preview_str.split('\n'):
-                    print(f"     {line}")
+                _print_preview(table_info['preview'])
 
     print("\n" + "=" * 70)
 
@@ -581,43 +932,41 @@ def glimpse_table(filepath: str, sheet: str, max_rows: int = 3):
         >>> glimpse_table('data.xlsx', 'Sheet1')
         >>> glimpse_table('data.xlsx', 'Sheet1', max_rows=5)
     """
-    reader = ExcelReader(filepath)
+    with ExcelReader(filepath) as reader:
 
-    if sheet not in reader.sheet_names:
-        print(f"\n❌ Sheet '{sheet}' not found!")
-        print(f"\nAvailable sheets:")
-        for s in reader.sheet_names:
-            print(f"  - '{s}'")
-        return
+        if sheet not in reader.sheet_names:
+            print(f"\n❌ Sheet '{sheet}' not found!")
+            print(f"\nAvailable sheets:")
+            for s in reader.sheet_names:
+                print(f"  - '{s}'")
+            return
 
-    # Try key-value table detection first
-    regions = reader.detect_key_value_tables(sheet)
+        # Try key-value table detection first
+        regions = reader.detect_key_value_tables(sheet)
 
-    if not regions:
-        # Fallback to general table detection
-        regions = reader.detect_tables(sheet)
+        if not regions:
+            # Fallback to general table detection
+            regions = reader.detect_tables(sheet)
 
-    print(f"\n📄 Sheet: '{sheet}'")
-    print("=" * 70)
+        print(f"\n📄 Sheet: '{sheet}'")
+        print("=" * 70)
 
-    if not regions:
-        print("  (no tables detected)")
-        return
+        if not regions:
+            print("  (no tables detected)")
+            return
 
-    for i, region in enumerate(regions, 1):
-        df = reader.read_key_value_region(sheet, region)
+        for i, region in enumerate(regions, 1):
+            # Read only the rows shown in the preview
+            df = reader.read_key_value_region(sheet, region, nrows=max_rows)
 
-        print(f"\n  {i}. '{region.name}'")
-        print(f"     Location: Rows {region.start_row}-{region.end_row}, Cols {region.start_col}-{region.end_col}")
-        print(f"     Size: {region.end_row - region.start_row + 1} rows × {region.end_col - region.start_col + 1} cols")
-        print(f"\n     Preview:")
+            print(f"\n  {i}. '{region.name}'")
+            print(f"     Location: Rows {region.start_row}-{region.end_row}, Cols {region.start_col}-{region.end_col}")
+            print(f"     Size: {region.end_row - region.start_row + 1} rows × {region.end_col - region.start_col + 1} cols")
+            print(f"\n     Preview:")
 
-        # Print with indentation
-        preview_str = str(df.head(max_rows))
-        for line in preview_str.split('\n'):
-            print(f"     {line}")
+            _print_preview(df.head(max_rows))
 
-    print("\n" + "=" * 70)
+        print("\n" + "=" * 70)
 
 
 def finmodel_output(data, columns: list = None, title: str = "Ausgabe") -> 'FinancialTable':
@@ -715,26 +1064,21 @@ def finmodel_output(data, columns: list = None, title: str = "Ausgabe") -> 'Fina
             # List of lists/tuples
             if len(first_item) == 2:
                 # Two columns: [(label, value), ...]
-                df = pd.DataFrame(data, columns=['Parameter', 'Value'])
-                df.set_index('Parameter', inplace=True)
+                if columns is not None and len(columns) != 1:
+                    raise ValueError(f"columns length ({len(columns)}) must be 1 for 2-element tuples")
+                df = pd.DataFrame.from_records(data, columns=['Parameter', 'Value'], index='Parameter')
                 if columns is not None:
-                    if len(columns) != 1:
-                        raise ValueError(f"columns length ({len(columns)}) must be 1 for 2-element tuples")
                     df.columns = columns
             else:
                 # More than 2 columns: [(label, val1, val2, ...), ...]
+                if columns is not None and len(columns) != len(first_item) - 1:
+                    raise ValueError(f"columns length ({len(columns)}) must be {len(first_item)-1}")
+                # Auto-generated names while the first field becomes the (unnamed) index
+                col_names = [f'Col_{i+1}' for i in range(len(first_item)-1)]
+                df = pd.DataFrame.from_records(data, columns=['Parameter', *col_names], index='Parameter')
+                df.index.name = None
                 if columns is not None:
-                    if len(columns) != len(first_item) - 1:
-                        raise ValueError(f"columns length ({len(columns)}) must be {len(first_item)-1}")
-                    df = pd.DataFrame([row[1:] for row in data], 
-                                     columns=columns,
-                                     index=[row[0] for row in data])
-                else:
-                    # Auto-generate column names
-                    col_names = [f'Col_{i+1}' for i in range(len(first_item)-1)]
-                    df = pd.DataFrame([row[1:] for row in data],
-                                     columns=col_names,
-                                     index=[row[0] for row in data])
+                    df.columns = columns
         else:
             raise ValueError("List items must be tuples or lists")
     
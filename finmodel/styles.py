@@ -4,12 +4,14 @@ Style presets for financial models.
 Defines color schemes and formatting rules for different table types.
 """
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import ClassVar, Dict, Final, Mapping, Optional
 import pandas as pd
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CellStyle:
     """Style definition for a cell."""
     background_color: Optional[str] = None
@@ -17,24 +19,30 @@ class CellStyle:
     font_weight: Optional[str] = None
     font_style: Optional[str] = None
     text_align: Optional[str] = None
+    _css: str = field(init=False, repr=False, compare=False)
+    
+    # Shared all-default style (CSS ""), set below once _cell_style exists
+    EMPTY: ClassVar["CellStyle"]
+    
+    def __post_init__(self):
+        # Styles are immutable, so the CSS string is built once (presets at import)
+        declarations = (
+            ("background-color: ", self.background_color),
+            ("color: ", self.text_color),
+            ("font-weight: ", self.font_weight),
+            ("font-style: ", self.font_style),
+            ("text-align: ", self.text_align),
+        )
+        object.__setattr__(self, '_css', "; ".join(
+            prefix + value for prefix, value in declarations if value
+        ))
     
     def to_css(self) -> str:
         """Convert to inline CSS string."""
-        styles = []
-        if self.background_color:
-            styles.append(f"background-color: {self.background_color}")
-        if self.text_color:
-            styles.append(f"color: {self.text_color}")
-        if self.font_weight:
-            styles.append(f"font-weight: {self.font_weight}")
-        if self.font_style:
-            styles.append(f"font-style: {self.font_style}")
-        if self.text_align:
-            styles.append(f"text-align: {self.text_align}")
-        return "; ".join(styles)
+        return self._css
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TableStyle:
     """Style definition for a table type."""
     name: str
@@ -44,25 +52,52 @@ class TableStyle:
     description: str = ""
 
 
+# Interned preset cell styles, so identical specs share one instance
+_CELL_STYLES: Dict[CellStyle, CellStyle] = {}
+
+
+def _cell_style(**fields) -> CellStyle:
+    """Return the shared CellStyle for these fields (creating it on first use)."""
+    style = CellStyle(**fields)
+    return _CELL_STYLES.setdefault(style, style)
+
+
+CellStyle.EMPTY = _cell_style()
+
+
+# Shared by the presets with plain white header and label cells
+_WHITE_BOLD_LEFT = _cell_style(
+    background_color="#FFFFFF",
+    text_color="#000000",
+    font_weight="bold",
+    text_align="left"
+)
+
+
 class StylePreset:
-    """Predefined style templates for financial models."""
+    """
+    Predefined style templates for financial models.
+    
+    The presets are frozen, shared constants: StylePreset.get() returns these
+    same objects, so they can be compared or cached by identity.
+    """
     
     # Financial model color codes (grey scale for assumptions)
-    ASSUMPTIONS = TableStyle(
+    ASSUMPTIONS: Final[TableStyle] = TableStyle(
         name="assumptions",
-        header_style=CellStyle(
+        header_style=_cell_style(
             background_color=None,  # No background
             text_color="#000000",
             font_weight="bold",
             text_align="left"
         ),
-        index_style=CellStyle(
+        index_style=_cell_style(
             background_color=None,  # No background for labels
             text_color="#000000",
             font_weight="bold",  # Labels are bold
             text_align="left"
         ),
-        data_style=CellStyle(
+        data_style=_cell_style(
             background_color="#D9D9D9",  # Light grey ONLY on value cells
             text_color="#000000",
             font_weight="normal",
@@ -71,46 +106,22 @@ class StylePreset:
         description="Grey background for assumption values (inputs/parameters)"
     )
     
-    # Blue for calculations (common in financial models)
-    CALCULATIONS = TableStyle(
-        name="calculations",
-        header_style=CellStyle(
-            background_color="#8FAADC",  # Light blue
-            text_color="#000000",  # Black text on light blue
-            font_weight="bold",
-            text_align="left"
-        ),
-        index_style=CellStyle(
-            background_color="#D9E2F3",  # Light blue
-            text_color="#000000",
-            font_weight="normal",
-            text_align="left"
-        ),
-        data_style=CellStyle(
-            background_color="#FFFFFF",  # White
-            text_color="#000000",
-            font_weight="normal",
-            text_align="right"
-        ),
-        description="Blue headers for calculated values"
-    )
-    
     # Standard/default style (light blue) - renamed from calculations
-    STANDARD = TableStyle(
+    STANDARD: Final[TableStyle] = TableStyle(
         name="standard",
-        header_style=CellStyle(
+        header_style=_cell_style(
             background_color="#8FAADC",  # Light blue
             text_color="#000000",
             font_weight="bold",
             text_align="left"
         ),
-        index_style=CellStyle(
+        index_style=_cell_style(
             background_color="#D9E2F3",  # Light blue
             text_color="#000000",
             font_weight="normal",
             text_align="left"
         ),
-        data_style=CellStyle(
+        data_style=_cell_style(
             background_color="#FFFFFF",  # White
             text_color="#000000",
             font_weight="normal",
@@ -120,24 +131,14 @@ class StylePreset:
     )
     
     # Keep CALCULATIONS as alias for backwards compatibility
-    CALCULATIONS = STANDARD
+    CALCULATIONS: Final[TableStyle] = STANDARD
     
     # Light orange for input data
-    INPUT_DATA = TableStyle(
+    INPUT_DATA: Final[TableStyle] = TableStyle(
         name="input_data",
-        header_style=CellStyle(
-            background_color="#FFFFFF",  # White header
-            text_color="#000000",
-            font_weight="bold",
-            text_align="left"
-        ),
-        index_style=CellStyle(
-            background_color="#FFFFFF",  # White
-            text_color="#000000",
-            font_weight="bold",
-            text_align="left"
-        ),
-        data_style=CellStyle(
+        header_style=_WHITE_BOLD_LEFT,  # White header
+        index_style=_WHITE_BOLD_LEFT,  # White
+        data_style=_cell_style(
             background_color="#FDE9D9",  # Light orange
             text_color="#000000",
             font_weight="normal",
@@ -147,21 +148,11 @@ class StylePreset:
     )
     
     # Light grey for calc_and_output
-    CALC_AND_OUTPUT = TableStyle(
+    CALC_AND_OUTPUT: Final[TableStyle] = TableStyle(
         name="calc_and_output",
-        header_style=CellStyle(
-            background_color="#FFFFFF",  # White header
-            text_color="#000000",
-            font_weight="bold",
-            text_align="left"
-        ),
-        index_style=CellStyle(
-            background_color="#FFFFFF",  # White
-            text_color="#000000",
-            font_weight="bold",
-            text_align="left"
-        ),
-        data_style=CellStyle(
+        header_style=_WHITE_BOLD_LEFT,  # White header
+        index_style=_WHITE_BOLD_LEFT,  # White
+        data_style=_cell_style(
             background_color="#F2F2F2",  # Light grey
             text_color="#000000",
             font_weight="normal",
@@ -171,21 +162,11 @@ class StylePreset:
     )
     
     # Light green for formulas/references
-    FORMULAS_OR_REFS = TableStyle(
+    FORMULAS_OR_REFS: Final[TableStyle] = TableStyle(
         name="formulas_or_refs",
-        header_style=CellStyle(
-            background_color="#FFFFFF",  # White header
-            text_color="#000000",
-            font_weight="bold",
-            text_align="left"
-        ),
-        index_style=CellStyle(
-            background_color="#FFFFFF",  # White
-            text_color="#000000",
-            font_weight="bold",
-            text_align="left"
-        ),
-        data_style=CellStyle(
+        header_style=_WHITE_BOLD_LEFT,  # White header
+        index_style=_WHITE_BOLD_LEFT,  # White
+        data_style=_cell_style(
             background_color="#E2EFDA",  # Light green
             text_color="#000000",
             font_weight="normal",
@@ -195,21 +176,11 @@ class StylePreset:
     )
     
     # Light violet for plausibility checks
-    PLAUSIBILITY = TableStyle(
+    PLAUSIBILITY: Final[TableStyle] = TableStyle(
         name="plausibility",
-        header_style=CellStyle(
-            background_color="#FFFFFF",  # White header
-            text_color="#000000",
-            font_weight="bold",
-            text_align="left"
-        ),
-        index_style=CellStyle(
-            background_color="#FFFFFF",  # White
-            text_color="#000000",
-            font_weight="bold",
-            text_align="left"
-        ),
-        data_style=CellStyle(
+        header_style=_WHITE_BOLD_LEFT,  # White header
+        index_style=_WHITE_BOLD_LEFT,  # White
+        data_style=_cell_style(
             background_color="#E9D7F3",  # Light violet
             text_color="#000000",
             font_weight="normal",
@@ -219,21 +190,21 @@ class StylePreset:
     )
     
     # Yellow for results
-    RESULTS = TableStyle(
+    RESULTS: Final[TableStyle] = TableStyle(
         name="results",
-        header_style=CellStyle(
+        header_style=_cell_style(
             background_color="#FFC000",  # Orange/yellow
             text_color="#000000",
             font_weight="bold",
             text_align="left"
         ),
-        index_style=CellStyle(
+        index_style=_cell_style(
             background_color="#FFF2CC",  # Light yellow
             text_color="#000000",
             font_weight="bold",
             text_align="left"
         ),
-        data_style=CellStyle(
+        data_style=_cell_style(
             background_color="#FFF2CC",  # Light yellow
             text_color="#000000",
             font_weight="normal",
@@ -243,30 +214,40 @@ class StylePreset:
     )
     
     # Keep OUTPUTS as alias for backwards compatibility
-    OUTPUTS = RESULTS
+    OUTPUTS: Final[TableStyle] = RESULTS
     
     @classmethod
     def get(cls, preset_name: str) -> TableStyle:
         """Get a style preset by name."""
-        preset_map = {
-            "assumptions": cls.ASSUMPTIONS,
-            "standard": cls.STANDARD,
-            "calculations": cls.CALCULATIONS,  # Alias for standard
-            "input_data": cls.INPUT_DATA,
-            "calc_and_output": cls.CALC_AND_OUTPUT,
-            "formulas_or_refs": cls.FORMULAS_OR_REFS,
-            "plausibility": cls.PLAUSIBILITY,
-            "results": cls.RESULTS,
-            "outputs": cls.OUTPUTS,  # Alias for results
-        }
-        
-        if preset_name.lower() not in preset_map:
-            raise ValueError(
-                f"Unknown preset: {preset_name}. "
-                f"Available: {', '.join(preset_map.keys())}"
-            )
-        
-        return preset_map[preset_name.lower()]
+        return _resolve_preset(preset_name)
+
+
+# Preset lookup table, built once at import
+_PRESET_MAP: Mapping[str, TableStyle] = MappingProxyType({
+    "assumptions": StylePreset.ASSUMPTIONS,
+    "standard": StylePreset.STANDARD,
+    "calculations": StylePreset.CALCULATIONS,  # Alias for standard
+    "input_data": StylePreset.INPUT_DATA,
+    "calc_and_output": StylePreset.CALC_AND_OUTPUT,
+    "formulas_or_refs": StylePreset.FORMULAS_OR_REFS,
+    "plausibility": StylePreset.PLAUSIBILITY,
+    "results": StylePreset.RESULTS,
+    "outputs": StylePreset.OUTPUTS,  # Alias for results
+})
+_AVAILABLE_PRESETS = ', '.join(_PRESET_MAP)
+
+
+@lru_cache(maxsize=32)
+def _resolve_preset(preset_name: str) -> TableStyle:
+    """Look up a preset by case-insensitive name (cached per raw spelling)."""
+    preset = _PRESET_MAP.get(preset_name.lower())
+    if preset is None:
+        raise ValueError(
+            f"Unknown preset: {preset_name}. "
+            f"Available: {_AVAILABLE_PRESETS}"
+        )
+    
+    return preset
 
 
 class FinancialTable:
@@ -288,6 +269,11 @@ class FinancialTable:
         )
     """
     
+    # Resolved on first render: the formatter module imports this one, and
+    # IPython is only needed for display()
+    _FORMATTERS = None
+    _IPYTHON_DISPLAY = None
+    
     def __init__(self, data, style: str = "standard", assertions=None):
         """
         Initialize a financial table.
@@ -298,50 +284,88 @@ class FinancialTable:
             assertions: Dict mapping assertion column names to boolean Series/conditions
                        Or a single boolean Series for a column named "Validation"
 
+        Without assertions a DataFrame is used as-is (not copied), so it
+        should be treated as read-only while the table is in use. Rendered
+        HTML/LaTeX is cached until self.df or self.style_preset is replaced;
+        modifying self.df in place is not supported.
+
         Note: Use Quarto cell directives for captions and labels:
             #| label: tbl-name
             #| tbl-cap: "Caption text"
         """
         if isinstance(data, dict):
             self.df = pd.DataFrame(data)
+        elif assertions is not None:
+            self.df = data.copy()  # Assertion columns are added below
         else:
-            self.df = data.copy()
+            self.df = data  # Rendering only reads the frame
         
         self.style_preset = StylePreset.get(style)
         self.assertions = assertions
+        self._html_cache = None
+        self._latex_cache = None
+        
+        # Normalise assertions to {column name: condition} once
+        if assertions is None:
+            conditions = {}
+        elif isinstance(assertions, pd.Series):
+            # Single assertion column
+            conditions = {'Validation': assertions}
+        elif isinstance(assertions, dict):
+            # Multiple assertion columns
+            conditions = assertions
+        else:
+            raise ValueError("assertions must be a pandas Series or dict of Series")
         
-        # Add assertion columns if provided
-        if assertions is not None:
-            if isinstance(assertions, pd.Series):
-                # Single assertion column
-                self.df['Validation'] = assertions.map({True: 'Ok', False: 'No'})
-            elif isinstance(assertions, dict):
-                # Multiple assertion columns
-                for col_name, condition in assertions.items():
-                    self.df[col_name] = condition.map({True: 'Ok', False: 'No'})
-            else:
-                raise ValueError("assertions must be a pandas Series or dict of Series")
+        # Add assertion columns
+        for col_name, condition in conditions.items():
+            self.df[col_name] = condition.map({True: 'Ok', False: 'No'})
+        
+        # Assertion column names, shared read-only with the formatters
+        self._assertion_columns = tuple(conditions)
+    
+    @classmethod
+    def _get_formatters(cls):
+        """Return (format_table, format_table_latex), importing the formatter on first use."""
+        if cls._FORMATTERS is None:
+            from .formatter import format_table, format_table_latex
+            cls._FORMATTERS = (format_table, format_table_latex)
+        return cls._FORMATTERS
+    
+    @classmethod
+    def _get_ipython_display(cls):
+        """Return IPython's (display, HTML), importing IPython on first use."""
+        if cls._IPYTHON_DISPLAY is None:
+            from IPython.display import display, HTML
+            cls._IPYTHON_DISPLAY = (display, HTML)
+        return cls._IPYTHON_DISPLAY
+    
+    def _is_cached(self, cache) -> bool:
+        """Check whether a render cache entry matches the current df and style."""
+        return cache is not None and cache[0] is self.df and cache[1] is self.style_preset
     
     def _repr_html_(self):
         """Return HTML representation for Jupyter."""
-        from .formatter import format_table
-        return format_table(self.df, self.style_preset, assertion_columns=self._get_assertion_columns())
+        # Cached per (df, style) object; in-place edits of self.df are not detected
+        if not self._is_cached(self._html_cache):
+            format_table, _ = self._get_formatters()
+            html = format_table(self.df, self.style_preset, assertion_columns=self._get_assertion_columns())
+            self._html_cache = (self.df, self.style_preset, html)
+        return self._html_cache[2]
     
     def _repr_latex_(self):
         """Return LaTeX representation with colors for PDF."""
-        from .formatter import format_table_latex
-        return format_table_latex(self.df, self.style_preset, assertion_columns=self._get_assertion_columns())
+        if not self._is_cached(self._latex_cache):
+            _, format_table_latex = self._get_formatters()
+            latex = format_table_latex(self.df, self.style_preset, assertion_columns=self._get_assertion_columns())
+            self._latex_cache = (self.df, self.style_preset, latex)
+        return self._latex_cache[2]
     
     def _get_assertion_columns(self):
-        """Get list of assertion column names."""
-        if self.assertions is None:
-            return []
-        elif isinstance(self.assertions, pd.Series):
-            return ['Validation']
-        else:
-            return list(self.assertions.keys())
+        """Get the assertion column names (computed once in __init__)."""
+        return self._assertion_columns
     
     def display(self):
         """Display the table in Jupyter (alias for IPython.display)."""
-        from IPython.display import display, HTML
+        display, HTML = self._get_ipython_display()
         display(HTML(self._repr_html_()))
\ No newline at end of file